@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: Apache-2.0
 import argparse
 import sys
-from typing import Iterator, List, Union, cast
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Union, cast
 
 import cwl_utils.parser.cwl_v1_0 as cwl
 
@@ -40,9 +41,12 @@ def main() -> None:
 
 def extract_software_packages(process: ProcessType) -> None:
     """Print software packages found in the given process."""
+    parts = []
     for req in extract_software_reqs(process):
-        print(process.id)
-        process_software_requirement(req)
+        parts.append(f"{process.id}\n")
+        parts.append(format_software_requirement(req))
+    if parts:
+        sys.stdout.write("".join(parts))
 
 
 def extract_software_reqs(
@@ -51,30 +55,32 @@ def extract_software_reqs(
     """Return an iterator over any SoftwareRequirements found in the given process."""
     if process.requirements:
         for req in process.requirements:
-            if isinstance(req, cwl.SoftwareRequirement):
+            if type(req) is cwl.SoftwareRequirement:
                 yield req
     if process.hints:
+        loader = cwl.SoftwareRequirementLoader
+        baseuri = process.id if process.id else ""
+        loadingOptions = process.loadingOptions
         for req in process.hints:
             if isinstance(req, cwl.ProcessRequirement):
-                if isinstance(req, cwl.SoftwareRequirement):
+                if type(req) is cwl.SoftwareRequirement:
                     yield req
-            elif req["class"] == "SoftwareRequirement":
-                yield cwl.load_field(
-                    req,
-                    cwl.SoftwareRequirementLoader,
-                    process.id if process.id else "",
-                    process.loadingOptions,
-                )
+            elif req.get("class") == "SoftwareRequirement":
+                yield cwl.load_field(req, loader, baseuri, loadingOptions)
+
+
+def format_software_requirement(req: cwl.SoftwareRequirement) -> str:
+    """Format the software package information, one line per package."""
+    return "".join(
+        f"Package: {package.package}, version: {package.version}, "
+        f"specs: {package.specs}\n"
+        for package in req.packages
+    )
 
 
 def process_software_requirement(req: cwl.SoftwareRequirement) -> None:
     """Pretty print the software package information."""
-    for package in req.packages:
-        print(
-            "Package: {}, version: {}, specs: {}".format(
-                package.package, package.version, package.specs
-            )
-        )
+    sys.stdout.write(format_software_requirement(req))
 
 
 def traverse(process: ProcessType) -> None:
@@ -91,11 +97,50 @@ def get_process_from_step(step: cwl.WorkflowStep) -> ProcessType:
     return cast(ProcessType, step.run)
 
 
+def load_step_processes(workflow: cwl.Workflow) -> Dict[str, ProcessType]:
+    """Load the processes of all (nested) steps, one workflow level at a time.
+
+    Each ``run`` URI is loaded once; the processes are returned by their URI.
+    """
+    processes: Dict[str, ProcessType] = {}
+    frontier = [workflow]
+    with ThreadPoolExecutor() as executor:
+        while frontier:
+            to_load: Dict[str, cwl.WorkflowStep] = {}
+            next_frontier = []
+            for wf in frontier:
+                for step in wf.steps:
+                    if isinstance(step.run, str):
+                        if step.run not in processes:
+                            to_load.setdefault(step.run, step)
+                    elif isinstance(step.run, cwl.Workflow):
+                        next_frontier.append(step.run)
+            loaded = executor.map(get_process_from_step, to_load.values())
+            for uri, process in zip(to_load, loaded):
+                processes[uri] = process
+                if isinstance(process, cwl.Workflow):
+                    next_frontier.append(process)
+            frontier = next_frontier
+    return processes
+
+
 def traverse_workflow(workflow: cwl.Workflow) -> None:
     """Iterate over the given workflow, extracting the software packages."""
-    for step in workflow.steps:
+    processes = load_step_processes(workflow)
+    stack: List[Iterator[Any]] = [iter(workflow.steps)]
+    while stack:
+        step = next(stack[-1], None)
+        if step is None:
+            stack.pop()
+            continue
         extract_software_packages(step)
-        traverse(get_process_from_step(step))
+        if isinstance(step.run, str):
+            process = processes[step.run]
+        else:
+            process = cast(ProcessType, step.run)
+        extract_software_packages(process)
+        if isinstance(process, cwl.Workflow):
+            stack.append(iter(process.steps))
 
 
 if __name__ == "__main__":
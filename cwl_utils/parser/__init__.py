@@ -1,109 +1,272 @@
 # SPDX-License-Identifier: Apache-2.0
+"""Load and save CWL documents of any supported CWL v1.x version.
 
+Each ``X`` type union below (e.g. ``Workflow``) is only meaningful to type
+checkers; for runtime checks use the matching ``XTypes`` tuple of classes,
+e.g. ``isinstance(obj, WorkflowTypes)``.
+"""
+import functools
+import importlib.util
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, MutableMapping, MutableSequence, Optional, Union, cast
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 from urllib.parse import unquote_plus, urlparse
 
 from schema_salad.exceptions import ValidationException
 from schema_salad.utils import yaml_no_ts
 
-from ..errors import GraphTargetMissingException
-from . import cwl_v1_0, cwl_v1_1, cwl_v1_2
+# absolute imports, as mypyc mis-resolves relative ones in a package __init__
+from cwl_utils.errors import GraphTargetMissingException
+from cwl_utils.parser import cwl_v1_0, cwl_v1_1, cwl_v1_2
 
 LoadingOptions = Union[
     cwl_v1_0.LoadingOptions, cwl_v1_1.LoadingOptions, cwl_v1_2.LoadingOptions
 ]
 """Type union for a CWL v1.x LoadingOptions object."""
+LoadingOptionsTypes = (
+    cwl_v1_0.LoadingOptions,
+    cwl_v1_1.LoadingOptions,
+    cwl_v1_2.LoadingOptions,
+)
 Saveable = Union[cwl_v1_0.Saveable, cwl_v1_1.Saveable, cwl_v1_2.Saveable]
 """Type union for a CWL v1.x Saveable object."""
+SaveableTypes = (cwl_v1_0.Saveable, cwl_v1_1.Saveable, cwl_v1_2.Saveable)
 InputParameter = Union[
     cwl_v1_0.InputParameter, cwl_v1_1.InputParameter, cwl_v1_2.InputParameter
 ]
 """Type union for a CWL v1.x InputParameter object."""
+InputParameterTypes = (
+    cwl_v1_0.InputParameter,
+    cwl_v1_1.InputParameter,
+    cwl_v1_2.InputParameter,
+)
 OutputParameter = Union[
     cwl_v1_0.OutputParameter, cwl_v1_1.OutputParameter, cwl_v1_2.OutputParameter
 ]
 """Type union for a CWL v1.x OutputParameter object."""
+OutputParameterTypes = (
+    cwl_v1_0.OutputParameter,
+    cwl_v1_1.OutputParameter,
+    cwl_v1_2.OutputParameter,
+)
 Workflow = Union[cwl_v1_0.Workflow, cwl_v1_1.Workflow, cwl_v1_2.Workflow]
-WorkflowTypes = (cwl_v1_0.Workflow, cwl_v1_1.Workflow, cwl_v1_2.Workflow)
 """Type union for a CWL v1.x Workflow object."""
+WorkflowTypes = (cwl_v1_0.Workflow, cwl_v1_1.Workflow, cwl_v1_2.Workflow)
 WorkflowInputParameter = Union[
     cwl_v1_0.InputParameter,
     cwl_v1_1.WorkflowInputParameter,
     cwl_v1_2.WorkflowInputParameter,
 ]
 """Type union for a CWL v1.x WorkflowInputParameter object."""
+WorkflowInputParameterTypes = (
+    cwl_v1_0.InputParameter,
+    cwl_v1_1.WorkflowInputParameter,
+    cwl_v1_2.WorkflowInputParameter,
+)
 WorkflowOutputParameter = Union[
     cwl_v1_0.WorkflowOutputParameter,
     cwl_v1_1.WorkflowOutputParameter,
     cwl_v1_2.WorkflowOutputParameter,
 ]
 """Type union for a CWL v1.x WorkflowOutputParameter object."""
+WorkflowOutputParameterTypes = (
+    cwl_v1_0.WorkflowOutputParameter,
+    cwl_v1_1.WorkflowOutputParameter,
+    cwl_v1_2.WorkflowOutputParameter,
+)
 WorkflowStep = Union[
     cwl_v1_0.WorkflowStep, cwl_v1_1.WorkflowStep, cwl_v1_2.WorkflowStep
 ]
 """Type union for a CWL v1.x WorkflowStep object."""
+WorkflowStepTypes = (
+    cwl_v1_0.WorkflowStep,
+    cwl_v1_1.WorkflowStep,
+    cwl_v1_2.WorkflowStep,
+)
 WorkflowStepInput = Union[
     cwl_v1_0.WorkflowStepInput, cwl_v1_1.WorkflowStepInput, cwl_v1_2.WorkflowStepInput
 ]
 """Type union for a CWL v1.x WorkflowStepInput object."""
+WorkflowStepInputTypes = (
+    cwl_v1_0.WorkflowStepInput,
+    cwl_v1_1.WorkflowStepInput,
+    cwl_v1_2.WorkflowStepInput,
+)
 WorkflowStepOutput = Union[
     cwl_v1_0.WorkflowStepOutput,
     cwl_v1_1.WorkflowStepOutput,
     cwl_v1_2.WorkflowStepOutput,
 ]
 """Type union for a CWL v1.x WorkflowStepOutput object."""
+WorkflowStepOutputTypes = (
+    cwl_v1_0.WorkflowStepOutput,
+    cwl_v1_1.WorkflowStepOutput,
+    cwl_v1_2.WorkflowStepOutput,
+)
 CommandLineTool = Union[
     cwl_v1_0.CommandLineTool, cwl_v1_1.CommandLineTool, cwl_v1_2.CommandLineTool
 ]
 """Type union for a CWL v1.x CommandLineTool object."""
+CommandLineToolTypes = (
+    cwl_v1_0.CommandLineTool,
+    cwl_v1_1.CommandLineTool,
+    cwl_v1_2.CommandLineTool,
+)
 CommandLineBinding = Union[
     cwl_v1_0.CommandLineBinding,
     cwl_v1_1.CommandLineBinding,
     cwl_v1_2.CommandLineBinding,
 ]
 """Type union for a CWL v1.x CommandLineBinding object."""
+CommandLineBindingTypes = (
+    cwl_v1_0.CommandLineBinding,
+    cwl_v1_1.CommandLineBinding,
+    cwl_v1_2.CommandLineBinding,
+)
 CommandOutputParameter = Union[
     cwl_v1_0.CommandOutputParameter,
     cwl_v1_1.CommandOutputParameter,
     cwl_v1_2.CommandOutputParameter,
 ]
 """Type union for a CWL v1.x CommandOutputParameter object."""
+CommandOutputParameterTypes = (
+    cwl_v1_0.CommandOutputParameter,
+    cwl_v1_1.CommandOutputParameter,
+    cwl_v1_2.CommandOutputParameter,
+)
 ExpressionTool = Union[
     cwl_v1_0.ExpressionTool, cwl_v1_1.ExpressionTool, cwl_v1_2.ExpressionTool
 ]
 """Type union for a CWL v1.x ExpressionTool object."""
+ExpressionToolTypes = (
+    cwl_v1_0.ExpressionTool,
+    cwl_v1_1.ExpressionTool,
+    cwl_v1_2.ExpressionTool,
+)
 DockerRequirement = Union[
     cwl_v1_0.DockerRequirement, cwl_v1_1.DockerRequirement, cwl_v1_2.DockerRequirement
 ]
+"""Type union for a CWL v1.x DockerRequirement object."""
 DockerRequirementTypes = (
     cwl_v1_0.DockerRequirement,
     cwl_v1_1.DockerRequirement,
     cwl_v1_2.DockerRequirement,
 )
-"""Type union for a CWL v1.x DockerRequirement object."""
 Process = Union[Workflow, CommandLineTool, ExpressionTool, cwl_v1_2.Operation]
 """Type Union for a CWL v1.x Process object."""
+ProcessTypes = (cwl_v1_0.Process, cwl_v1_1.Process, cwl_v1_2.Process)
 ArraySchema = Union[cwl_v1_0.ArraySchema, cwl_v1_1.ArraySchema, cwl_v1_2.ArraySchema]
 """Type Union for a CWL v1.x ArraySchema object."""
+ArraySchemaTypes = (cwl_v1_0.ArraySchema, cwl_v1_1.ArraySchema, cwl_v1_2.ArraySchema)
 EnumSchema = Union[cwl_v1_0.EnumSchema, cwl_v1_1.EnumSchema, cwl_v1_2.EnumSchema]
 """Type Union for a CWL v1.x EnumSchema object."""
+EnumSchemaTypes = (cwl_v1_0.EnumSchema, cwl_v1_1.EnumSchema, cwl_v1_2.EnumSchema)
 RecordSchema = Union[
     cwl_v1_0.RecordSchema, cwl_v1_1.RecordSchema, cwl_v1_2.RecordSchema
 ]
 """Type Union for a CWL v1.x RecordSchema object."""
+RecordSchemaTypes = (
+    cwl_v1_0.RecordSchema,
+    cwl_v1_1.RecordSchema,
+    cwl_v1_2.RecordSchema,
+)
 File = Union[cwl_v1_0.File, cwl_v1_1.File, cwl_v1_2.File]
 """Type Union for a CWL v1.x File object."""
+FileTypes = (cwl_v1_0.File, cwl_v1_1.File, cwl_v1_2.File)
 SecondaryFileSchema = Union[cwl_v1_1.SecondaryFileSchema, cwl_v1_2.SecondaryFileSchema]
 """Type Union for a CWL v1.x SecondaryFileSchema object."""
+SecondaryFileSchemaTypes = (cwl_v1_1.SecondaryFileSchema, cwl_v1_2.SecondaryFileSchema)
 Directory = Union[cwl_v1_0.Directory, cwl_v1_1.Directory, cwl_v1_2.Directory]
 """Type Union for a CWL v1.x Directory object."""
+DirectoryTypes = (cwl_v1_0.Directory, cwl_v1_1.Directory, cwl_v1_2.Directory)
 Dirent = Union[cwl_v1_0.Dirent, cwl_v1_1.Dirent, cwl_v1_2.Dirent]
 """Type Union for a CWL v1.x Dirent object."""
+DirentTypes = (cwl_v1_0.Dirent, cwl_v1_1.Dirent, cwl_v1_2.Dirent)
 
 _Loader = Union[cwl_v1_0._Loader, cwl_v1_1._Loader, cwl_v1_2._Loader]
 
+USE_LIBYAML = importlib.util.find_spec("yaml") is not None
+"""Parse CWL documents with PyYAML (libyaml accelerated where available).
+
+Set to ``False`` to always use the ruamel.yaml round-trip parser.
+"""
+
+
+def _libyaml_loader() -> Any:
+    """Return the PyYAML loader class used by :py:func:`_fast_yaml_load`.
+
+    PyYAML is only imported here, on first use.
+    """
+    from cwl_utils.parser.libyaml_loader import CWLSafeLoader
+
+    return CWLSafeLoader
+
+
+def _check_version_node(node: Any) -> None:
+    """Reject a composed YAML document by its cwlVersion before constructing it.
+
+    Only raises when load_document_by_yaml() would certainly fail the same
+    way; documents with a $graph or merge keys are left to the full check.
+    """
+    if node is None or node.tag != "tag:yaml.org,2002:map":
+        raise ValidationException("MutableMapping is required")
+    version_node = None
+    for key_node, value_node in node.value:
+        if key_node.tag != "tag:yaml.org,2002:str":
+            if key_node.tag == "tag:yaml.org,2002:merge":
+                return
+        elif key_node.value == "$graph":
+            return
+        elif key_node.value == "cwlVersion":
+            version_node = value_node
+    if version_node is None:
+        raise ValidationException("could not get the cwlVersion")
+    if (
+        version_node.tag == "tag:yaml.org,2002:str"
+        and version_node.value not in _VERSION_LOADERS
+    ):
+        raise ValidationException(
+            f"Version error. Did not recognise {version_node.value} as a CWL version"
+        )
+
+
+def _fast_yaml_load(string: str) -> Any:
+    """Parse a YAML string, preferring the libyaml based loader.
+
+    With libyaml the document is first composed into a node graph, so that
+    documents without a usable cwlVersion are rejected before any Python
+    objects are constructed. YAML errors (e.g. duplicate keys) are reported
+    by re-parsing with ruamel.yaml, so they are raised as before.
+    """
+    if USE_LIBYAML:
+        from cwl_utils.parser.libyaml_loader import YAMLError
+
+        loader = _libyaml_loader()(string)
+        try:
+            node = loader.get_single_node()
+            _check_version_node(node)
+            return loader.construct_document(node)
+        except YAMLError:
+            pass
+        finally:
+            loader.dispose()
+    yaml_parser = yaml_no_ts()
+    return yaml_parser.load(string)
+
 
 def _get_id_from_graph(yaml: MutableMapping[str, Any], id_: Optional[str]) -> Any:
     if id_ is None:
@@ -126,18 +289,25 @@ def cwl_version(yaml: Any) -> Optional[str]:
     """
     if not isinstance(yaml, MutableMapping):
         raise ValidationException("MutableMapping is required")
-    if "cwlVersion" not in list(yaml.keys()):
+    if "cwlVersion" not in yaml:
         return None
-    return cast(str, yaml["cwlVersion"])
+    version = yaml["cwlVersion"]
+    if type(version) is str:
+        # share one string object between all documents of the same version,
+        # which also lets the _VERSION_LOADERS lookup match on identity
+        version = sys.intern(version)
+    return cast(str, version)
 
 
-def load_document_by_uri(
-    path: Union[str, Path],
-    loadingOptions: Optional[LoadingOptions] = None,
-    load_all: bool = False,
-) -> Any:
-    """Load a CWL object from a URI or a path."""
+_URI_SPECIAL_CHARS = frozenset(":#?;%+")
+
+
+def _resolve_uri(path: Union[str, Path]) -> Tuple[str, Optional[str]]:
+    """Return the absolute URI and the fragment id (if any) for a URI or path."""
     if isinstance(path, str):
+        if _URI_SPECIAL_CHARS.isdisjoint(path):
+            # plain local path: no scheme, fragment, query or escapes to handle
+            return Path(path).resolve().as_uri(), None
         uri = urlparse(path)
         id_ = uri.fragment or None
         if not uri.scheme or uri.scheme == "file":
@@ -145,18 +315,103 @@ def load_document_by_uri(
         else:
             real_path = path
     else:
-        real_path = path.resolve().as_uri()
-        id_ = path.resolve().name.split("#")[1] if "#" in path.resolve().name else None
+        resolved = path.resolve()
+        real_path = resolved.as_uri()
+        id_ = resolved.name.split("#", 1)[1] if "#" in resolved.name else None
+    return real_path, id_
+
+
+def load_document_by_uri(
+    path: Union[str, Path],
+    loadingOptions: Optional[LoadingOptions] = None,
+    load_all: bool = False,
+) -> Any:
+    """Load a CWL object from a URI or a path.
+
+    Without `loadingOptions`, the text of remote (non ``file:``) documents
+    is cached by URI, so documents referenced several times are only fetched
+    once. Local files are always read again. Call
+    :py:func:`clear_document_cache` to drop the cache, e.g. after a remote
+    document has changed.
+    """
+    real_path, id_ = _resolve_uri(path)
 
     baseuri = str(real_path)
 
+    doc = _fetch_text(real_path, loadingOptions)
+
     if loadingOptions is None:
         loadingOptions = cwl_v1_2.LoadingOptions(fileuri=baseuri)
 
-    doc = loadingOptions.fetcher.fetch_text(real_path)
     return load_document_by_string(doc, baseuri, loadingOptions, id_, load_all)
 
 
+def _fetch_text(real_path: str, loadingOptions: Optional[LoadingOptions]) -> str:
+    """Fetch the text of a document, using the default fetcher if no options.
+
+    Only remote documents fetched with the default fetcher are cached: local
+    files may change between calls, and caching by `loadingOptions` would
+    keep every LoadingOptions (and its index of loaded documents) alive.
+    """
+    if loadingOptions is None:
+        if not real_path.startswith("file:"):
+            return _fetch_remote_text_cached(real_path)
+        loadingOptions = cwl_v1_2.LoadingOptions(fileuri=real_path)
+    return loadingOptions.fetcher.fetch_text(real_path)
+
+
+def _fetch_remote_text(real_path: str) -> str:
+    """Fetch the text of a remote document with the default fetcher."""
+    return cwl_v1_2.LoadingOptions(fileuri=real_path).fetcher.fetch_text(real_path)
+
+
+# wrapped explicitly (not decorated) so that cache_clear() and cache_info()
+# stay reachable when this module is compiled with mypyc
+_fetch_remote_text_cached = functools.lru_cache(maxsize=256)(_fetch_remote_text)
+
+
+def clear_document_cache() -> None:
+    """Forget the document texts cached by :py:func:`load_document_by_uri`."""
+    _fetch_remote_text_cached.cache_clear()
+
+
+def load_documents_by_uri(
+    paths: Sequence[Union[str, Path]],
+    loadingOptions: Optional[LoadingOptions] = None,
+    load_all: bool = False,
+    max_workers: Optional[int] = None,
+) -> List[Any]:
+    """Load several CWL objects from URIs or paths.
+
+    The documents are fetched concurrently; each one is parsed as soon as its
+    text is available, and the results are returned in the order of `paths`.
+    """
+    resolved = [_resolve_uri(path) for path in paths]
+    options = [
+        loadingOptions
+        if loadingOptions is not None
+        else cwl_v1_2.LoadingOptions(fileuri=real_path)
+        for real_path, _ in resolved
+    ]
+
+    def fetch(real_path: str) -> str:
+        return _fetch_text(real_path, loadingOptions)
+
+    results: List[Any] = [None] * len(resolved)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(fetch, real_path): index
+            for index, (real_path, _) in enumerate(resolved)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            real_path, id_ = resolved[index]
+            results[index] = load_document_by_string(
+                future.result(), real_path, options[index], id_, load_all
+            )
+    return results
+
+
 def load_document(
     doc: Any,
     baseuri: Optional[str] = None,
@@ -180,11 +435,17 @@ def load_document_by_string(
     load_all: bool = False,
 ) -> Any:
     """Load a CWL object from a serialized YAML string."""
-    yaml = yaml_no_ts()
-    result = yaml.load(string)
+    result = _fast_yaml_load(string)
     return load_document_by_yaml(result, uri, loadingOptions, id_, load_all)
 
 
+_VERSION_LOADERS: Dict[str, Callable[[Any, str, Optional[Any]], Any]] = {
+    "v1.0": cwl_v1_0.load_document_by_yaml,
+    "v1.1": cwl_v1_1.load_document_by_yaml,
+    "v1.2": cwl_v1_2.load_document_by_yaml,
+}
+
+
 def load_document_by_yaml(
     yaml: Any,
     uri: str,
@@ -197,35 +458,52 @@ def load_document_by_yaml(
     if "$graph" in yaml and not load_all:
         yaml = _get_id_from_graph(yaml, id_)
         yaml["cwlVersion"] = version
-    if version == "v1.0":
-        result = cwl_v1_0.load_document_by_yaml(
-            yaml, uri, cast(Optional[cwl_v1_0.LoadingOptions], loadingOptions)
-        )
-    elif version == "v1.1":
-        result = cwl_v1_1.load_document_by_yaml(
-            yaml, uri, cast(Optional[cwl_v1_1.LoadingOptions], loadingOptions)
-        )
-    elif version == "v1.2":
-        result = cwl_v1_2.load_document_by_yaml(
-            yaml, uri, cast(Optional[cwl_v1_2.LoadingOptions], loadingOptions)
-        )
-    elif version is None:
-        raise ValidationException("could not get the cwlVersion")
-    else:
+    loader = _VERSION_LOADERS.get(version) if isinstance(version, str) else None
+    if loader is None:
+        if version is None:
+            raise ValidationException("could not get the cwlVersion")
         raise ValidationException(
             f"Version error. Did not recognise {version} as a CWL version"
         )
+    result = loader(yaml, uri, loadingOptions)
 
     if isinstance(result, MutableSequence):
-        lst = []
         for r in result:
             if "cwlVersion" in r.attrs:
                 r.cwlVersion = version
-            lst.append(r)
-        return lst
+        return list(result)
     return result
 
 
+_SAVE_LEAF, _SAVE_SAVEABLE, _SAVE_SEQUENCE, _SAVE_MAPPING = range(4)
+_save_kinds: Dict[type, int] = {
+    bool: _SAVE_LEAF,
+    float: _SAVE_LEAF,
+    int: _SAVE_LEAF,
+    str: _SAVE_LEAF,
+    type(None): _SAVE_LEAF,
+    list: _SAVE_SEQUENCE,
+    dict: _SAVE_MAPPING,
+}
+
+
+def _save_kind(val: Any) -> int:
+    """Classify a value for save(), caching the answer per type."""
+    val_type = type(val)
+    kind = _save_kinds.get(val_type)
+    if kind is None:
+        if isinstance(val, SaveableTypes):
+            kind = _SAVE_SAVEABLE
+        elif isinstance(val, MutableSequence):
+            kind = _SAVE_SEQUENCE
+        elif isinstance(val, MutableMapping):
+            kind = _SAVE_MAPPING
+        else:
+            kind = _SAVE_LEAF
+        _save_kinds[val_type] = kind
+    return kind
+
+
 def save(
     val: Optional[Union[Saveable, MutableSequence[Saveable]]],
     top: bool = True,
@@ -233,45 +511,50 @@ def save(
     relative_uris: bool = True,
 ) -> Any:
     """Convert a CWL Python object into a JSON/YAML serializable object."""
-    if (
-        isinstance(val, cwl_v1_0.Saveable)
-        or isinstance(val, cwl_v1_1.Saveable)
-        or isinstance(val, cwl_v1_2.Saveable)
-    ):
-        return val.save(top=top, base_url=base_url, relative_uris=relative_uris)
-    if isinstance(val, MutableSequence):
-        lst = [
-            save(v, top=top, base_url=base_url, relative_uris=relative_uris)
-            for v in val
-        ]
-        if top and all(is_process(v) for v in val):
-            vers = [
-                e.get("cwlVersion") for i, e in enumerate(lst) if is_process(val[i])
-            ]
-            latest = max(
-                (v for v in vers if v is not None), key=cast(Any, version_split)
+    result: List[Any] = [None]
+    # (container, key, value, top) of every value still to be converted
+    stack: List[Tuple[Any, Any, Any, bool]] = [(result, 0, val, top)]
+    while stack:
+        parent, key, value, value_top = stack.pop()
+        kind = _save_kind(value)
+        if kind == _SAVE_SAVEABLE:
+            parent[key] = value.save(
+                top=value_top, base_url=base_url, relative_uris=relative_uris
             )
-            return {"cwlVersion": latest, "$graph": lst}
-        return lst
-    if isinstance(val, MutableMapping):
-        newdict = {}
-        for key in val:
-            newdict[key] = save(
-                val[key], top=False, base_url=base_url, relative_uris=relative_uris
-            )
-        return newdict
-    return val
+        elif kind == _SAVE_SEQUENCE:
+            if value_top and all(is_process(v) for v in value):
+                lst = [
+                    v.save(top=True, base_url=base_url, relative_uris=relative_uris)
+                    for v in value
+                ]
+                vers = [e.get("cwlVersion") for e in lst]
+                latest = max((v for v in vers if v is not None), key=version_split)
+                parent[key] = {"cwlVersion": latest, "$graph": lst}
+                continue
+            lst = list(value)
+            parent[key] = lst
+            for index, item in enumerate(value):
+                if _save_kind(item) != _SAVE_LEAF:
+                    stack.append((lst, index, item, value_top))
+        elif kind == _SAVE_MAPPING:
+            newdict = dict(value)
+            parent[key] = newdict
+            for item_key, item in newdict.items():
+                if _save_kind(item) != _SAVE_LEAF:
+                    stack.append((newdict, item_key, item, False))
+        else:
+            parent[key] = value
+    return result[0]
 
 
 def is_process(v: Any) -> bool:
     """Test to see if the object is a CWL v1.x Python Process object."""
-    return (
-        isinstance(v, cwl_v1_0.Process)
-        or isinstance(v, cwl_v1_1.Process)
-        or isinstance(v, cwl_v1_2.Process)
-    )
+    return isinstance(v, ProcessTypes)
 
 
-def version_split(version: str) -> MutableSequence[int]:
+@functools.lru_cache(maxsize=16)
+def version_split(version: str) -> Tuple[int, ...]:
     """Split a cwlVersion value into its numerical components."""
-    return [int(v) for v in version[1:].split(".")]
+    if version.startswith("v"):
+        version = version[1:]
+    return tuple(map(int, version.split(".")))
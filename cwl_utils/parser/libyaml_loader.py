@@ -0,0 +1,155 @@
+# SPDX-License-Identifier: Apache-2.0
+"""PyYAML loader for CWL documents, used by :py:mod:`cwl_utils.parser`.
+
+The loader resolves scalars with the YAML 1.2 core schema and without
+timestamps, mirroring :py:func:`schema_salad.utils.yaml_no_ts` so that both
+parsers produce the same Python objects. Mappings and sequences are built as
+ruamel.yaml ``CommentedMap`` and ``CommentedSeq`` objects with the same line
+and column information, so validation errors still report their locations.
+
+This module is imported on first use only, and is never compiled with mypyc:
+PyYAML looks up ``construct_mapping`` and the constructors on the loader
+class, which needs them to be plain Python methods and functions.
+"""
+import re
+from typing import Any, Dict, Hashable, Iterator, Set
+
+import yaml
+from ruamel.yaml.comments import CommentedMap, CommentedSeq
+from yaml.constructor import ConstructorError, SafeConstructor
+from yaml.nodes import MappingNode, ScalarNode, SequenceNode
+
+try:
+    from yaml import CSafeLoader as _BaseLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader as _BaseLoader  # type: ignore[assignment]
+
+YAMLError = yaml.YAMLError
+
+_YAML11_TAGS = (
+    "tag:yaml.org,2002:bool",
+    "tag:yaml.org,2002:float",
+    "tag:yaml.org,2002:int",
+    "tag:yaml.org,2002:timestamp",
+)
+
+_INT_BASES = {"0b": 2, "0o": 8, "0x": 16}
+
+
+class CWLSafeLoader(_BaseLoader):
+    """Safe PyYAML loader for CWL documents, see the module docstring."""
+
+    def construct_mapping(
+        self, node: MappingNode, deep: bool = False
+    ) -> Dict[Hashable, Any]:
+        """Construct a mapping, rejecting duplicate keys as ruamel.yaml does."""
+        if isinstance(node, MappingNode):
+            keys: Set[Any] = set()
+            for key_node, _ in node.value:
+                if key_node.tag == "tag:yaml.org,2002:merge":
+                    continue
+                key = self.construct_object(key_node, deep=deep)
+                try:
+                    duplicate = key in keys
+                except TypeError:
+                    continue  # unhashable keys are reported by the base class
+                if duplicate:
+                    raise ConstructorError(
+                        "while constructing a mapping",
+                        node.start_mark,
+                        f"found duplicate key {key!r}",
+                        key_node.start_mark,
+                    )
+                keys.add(key)
+        return SafeConstructor.construct_mapping(self, node, deep)
+
+    def construct_commented_map(self, node: MappingNode) -> Iterator[CommentedMap]:
+        """Construct a CommentedMap, recording where each key and value starts."""
+        data = CommentedMap()
+        data._yaml_set_line_col(node.start_mark.line, node.start_mark.column)
+        yield data
+        data.update(self.construct_mapping(node))
+        lc = data.lc
+        # construct_mapping() has merged any '<<' keys into node.value
+        for key_node, value_node in node.value:
+            lc.add_kv_line_col(
+                self.construct_object(key_node),
+                [
+                    key_node.start_mark.line,
+                    key_node.start_mark.column,
+                    value_node.start_mark.line,
+                    value_node.start_mark.column,
+                ],
+            )
+
+    def construct_commented_seq(self, node: SequenceNode) -> Iterator[CommentedSeq]:
+        """Construct a CommentedSeq, recording where each item starts."""
+        data = CommentedSeq()
+        data._yaml_set_line_col(node.start_mark.line, node.start_mark.column)
+        yield data
+        data.extend(self.construct_sequence(node))
+        lc = data.lc
+        for index, item_node in enumerate(node.value):
+            lc.add_kv_line_col(
+                index, [item_node.start_mark.line, item_node.start_mark.column]
+            )
+
+    def construct_yaml12_int(self, node: ScalarNode) -> int:
+        """Construct an int with YAML 1.2 core schema semantics.
+
+        PyYAML follows YAML 1.1, where a leading ``0`` means octal; in YAML 1.2
+        (and so in ruamel.yaml) ``017`` is 17 and only ``0o17`` is octal.
+        """
+        value = str(self.construct_scalar(node)).replace("_", "")
+        sign = 1
+        if value[:1] in ("+", "-"):
+            if value[0] == "-":
+                sign = -1
+            value = value[1:]
+        base = _INT_BASES.get(value[:2], 10)
+        if base != 10:
+            value = value[2:]
+        return sign * int(value, base)
+
+
+CWLSafeLoader.yaml_implicit_resolvers = {
+    first: [(tag, regexp) for tag, regexp in resolvers if tag not in _YAML11_TAGS]
+    for first, resolvers in _BaseLoader.yaml_implicit_resolvers.items()
+}
+CWLSafeLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:bool",
+    re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$"),
+    list("tTfF"),
+)
+CWLSafeLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:float",
+    re.compile(
+        r"""^(?:[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+]?[0-9]+)?
+        |[-+]?(?:[0-9][0-9_]*)(?:[eE][-+]?[0-9]+)
+        |[-+]?\.[0-9_]+(?:[eE][-+][0-9]+)?
+        |[-+]?\.(?:inf|Inf|INF)
+        |\.(?:nan|NaN|NAN))$""",
+        re.X,
+    ),
+    list("-+0123456789."),
+)
+CWLSafeLoader.add_implicit_resolver(
+    "tag:yaml.org,2002:int",
+    re.compile(
+        r"""^(?:[-+]?0b[0-1_]+
+        |[-+]?0o?[0-7_]+
+        |[-+]?[0-9_]+
+        |[-+]?0x[0-9a-fA-F_]+)$""",
+        re.X,
+    ),
+    list("-+0123456789"),
+)
+CWLSafeLoader.add_constructor(
+    "tag:yaml.org,2002:int", CWLSafeLoader.construct_yaml12_int
+)
+CWLSafeLoader.add_constructor(
+    "tag:yaml.org,2002:map", CWLSafeLoader.construct_commented_map
+)
+CWLSafeLoader.add_constructor(
+    "tag:yaml.org,2002:seq", CWLSafeLoader.construct_commented_seq
+)
@@ -14,6 +14,31 @@ exec(open("cwl_utils/__meta__.py").read())
 
 needs_pytest = {"pytest", "test", "ptr"}.intersection(sys.argv)
 pytest_runner: List[str] = ["pytest < 8", "pytest-runner"] if needs_pytest else []
+
+USE_MYPYC = False
+# Opt-in compilation with mypyc (shipped with mypy); pure Python otherwise
+if len(sys.argv) > 1 and sys.argv[1] == "--use-mypyc":
+    sys.argv.pop(1)
+    USE_MYPYC = True
+if os.getenv("CWL_UTILS_USE_MYPYC", None) == "1":
+    USE_MYPYC = True
+
+if USE_MYPYC:
+    mypyc_targets = [
+        "cwl_utils/cite_extract.py",
+        "cwl_utils/parser/__init__.py",
+    ]
+
+    from mypyc.build import mypycify
+
+    os.environ["MYPYPATH"] = os.pathsep.join(
+        filter(None, (os.getenv("MYPYPATH"), os.path.join(SETUP_DIR, "mypy-stubs")))
+    )
+    opt_level = os.getenv("MYPYC_OPT_LEVEL", "3")
+    ext_modules = mypycify(mypyc_targets, opt_level=opt_level)
+else:
+    ext_modules = []
+
 setup(
     name="cwl-utils",
     version=__version__,  # type: ignore  # noqa: F821
@@ -26,6 +51,7 @@ setup(
     python_requires=">=3.6",
     setup_requires=pytest_runner,
     packages=["cwl_utils", "cwl_utils.parser", "cwl_utils.tests", "cwl_utils.testdata"],
+    ext_modules=ext_modules,
     package_dir={
         "cwl_utils.parser": "cwl_utils/parser",
         "cwl_utils.tests": "tests",
@@ -39,7 +65,7 @@ setup(
     .splitlines(),
     tests_require=["pytest<8", "pytest-mock"],
     test_suite="tests",
-    extras_require={"pretty": ["cwlformat"]},
+    extras_require={"pretty": ["cwlformat"], "libyaml": ["PyYAML"]},
     entry_points={
         "console_scripts": [
             "cwl-cite-extract=cwl_utils.cite_extract:main",
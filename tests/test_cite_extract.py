@@ -1,7 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0
 """Tests for cwl-cite-extract."""
+from pathlib import Path
+from typing import Any, List, cast
+
+from pytest import CaptureFixture, MonkeyPatch
+
 import cwl_utils.parser.cwl_v1_0 as parser
-from cwl_utils.cite_extract import traverse_workflow
+from cwl_utils.cite_extract import (
+    extract_software_packages,
+    extract_software_reqs,
+    traverse_workflow,
+)
 
 from .util import get_data
 
@@ -10,3 +19,127 @@ def test_traverse_workflow() -> None:
     """Test the citation extraction, simply."""
     loaded = parser.load_document(get_data("testdata/md5sum.cwl"))
     traverse_workflow(loaded)
+
+
+SHARED_TOOL = """cwlVersion: v1.0
+class: CommandLineTool
+baseCommand: md5sum
+hints:
+  SoftwareRequirement:
+    packages:
+      md5sum:
+        version: ["1.0"]
+inputs: []
+outputs: []
+"""
+
+SHARED_SUBWORKFLOW = """cwlVersion: v1.0
+class: Workflow
+inputs: []
+outputs: []
+steps:
+  inner:
+    run: tool.cwl
+    in: {}
+    out: []
+"""
+
+SHARED_WORKFLOW = """cwlVersion: v1.0
+class: Workflow
+inputs: []
+outputs: []
+requirements:
+  SubworkflowFeatureRequirement: {}
+steps:
+  first:
+    run: sub.cwl
+    in: {}
+    out: []
+  second:
+    run: sub.cwl
+    in: {}
+    out: []
+  third:
+    run: tool.cwl
+    in: {}
+    out: []
+"""
+
+
+def test_traverse_workflow_shared_subworkflow(
+    tmp_path: Path, monkeypatch: MonkeyPatch, capsys: CaptureFixture[str]
+) -> None:
+    """Test a nested, shared sub-workflow: each document is loaded only once."""
+    (tmp_path / "tool.cwl").write_text(SHARED_TOOL)
+    (tmp_path / "sub.cwl").write_text(SHARED_SUBWORKFLOW)
+    (tmp_path / "main.cwl").write_text(SHARED_WORKFLOW)
+    loaded = parser.load_document(str(tmp_path / "main.cwl"))
+    load_document = parser.load_document
+    uris: List[str] = []
+
+    def counting_load_document(doc: Any, *args: Any, **kwargs: Any) -> Any:
+        uris.append(doc)
+        return load_document(doc, *args, **kwargs)
+
+    monkeypatch.setattr(parser, "load_document", counting_load_document)
+    traverse_workflow(loaded)
+    tool_uri = (tmp_path / "tool.cwl").as_uri()
+    assert sorted(uris) == [(tmp_path / "sub.cwl").as_uri(), tool_uri]
+    line = "Package: md5sum, version: ['1.0'], specs: None\n"
+    assert capsys.readouterr().out == f"{tool_uri}\n{line}" * 3
+
+
+def test_traverse_workflow_reloads_changed_documents(
+    tmp_path: Path, capsys: CaptureFixture[str]
+) -> None:
+    """Test that loaded processes are not kept between traversals."""
+    (tmp_path / "tool.cwl").write_text(SHARED_TOOL)
+    (tmp_path / "sub.cwl").write_text(SHARED_SUBWORKFLOW)
+    (tmp_path / "main.cwl").write_text(SHARED_WORKFLOW)
+    loaded = parser.load_document(str(tmp_path / "main.cwl"))
+    traverse_workflow(loaded)
+    assert "version: ['1.0']" in capsys.readouterr().out
+    (tmp_path / "tool.cwl").write_text(SHARED_TOOL.replace('["1.0"]', '["2.0"]'))
+    traverse_workflow(loaded)
+    output = capsys.readouterr().out
+    assert "version: ['2.0']" in output
+    assert "version: ['1.0']" not in output
+
+
+def _load_tool_with_software_reqs() -> parser.CommandLineTool:
+    software_req = {
+        "class": "SoftwareRequirement",
+        "packages": [{"package": "md5sum", "version": ["1.0"]}],
+    }
+    return cast(
+        parser.CommandLineTool,
+        parser.load_document(
+            {
+                "cwlVersion": "v1.0",
+                "class": "CommandLineTool",
+                "id": "#tool",
+                "inputs": [],
+                "outputs": [],
+                "requirements": [software_req],
+                "hints": [{"class": "ResourceRequirement"}, software_req],
+            },
+            baseuri=Path(get_data("testdata/md5sum.cwl")).as_uri(),
+        ),
+    )
+
+
+def test_extract_software_reqs() -> None:
+    """Test finding SoftwareRequirements in both requirements and hints."""
+    tool = _load_tool_with_software_reqs()
+    reqs = list(extract_software_reqs(tool))
+    assert len(reqs) == 2
+    assert all(isinstance(req, parser.SoftwareRequirement) for req in reqs)
+    assert reqs[1].packages[0].package == "md5sum"
+
+
+def test_extract_software_packages(capsys: CaptureFixture[str]) -> None:
+    """Test the printed package information."""
+    tool = _load_tool_with_software_reqs()
+    extract_software_packages(tool)
+    line = "Package: md5sum, version: ['1.0'], specs: None\n"
+    assert capsys.readouterr().out == f"{tool.id}\n{line}" * 2
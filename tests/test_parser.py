@@ -1,18 +1,28 @@
 # SPDX-License-Identifier: Apache-2.0
 """Test the load and save functions for CWL."""
 from pathlib import Path
+from typing import Any, List
 
-from pytest import raises
+import pytest
+from pytest import MonkeyPatch, raises
+from ruamel.yaml.constructor import DuplicateKeyError
 from ruamel.yaml.main import YAML
+from schema_salad.exceptions import ValidationException
+from schema_salad.fetcher import DefaultFetcher
 
+import cwl_utils.parser
 import cwl_utils.parser.latest as latest
 from cwl_utils.errors import GraphTargetMissingException
 from cwl_utils.parser import (
+    clear_document_cache,
     cwl_v1_2,
     cwl_version,
     load_document,
+    load_document_by_string,
     load_document_by_uri,
+    load_documents_by_uri,
     save,
+    version_split,
 )
 
 from .util import get_data
@@ -121,3 +131,170 @@ def test_graph_load_all() -> None:
     uri = Path(get_data("testdata/js-expr-req-wf.cwl")).resolve().as_uri()
     cwl_objs = load_document_by_uri(uri, load_all=True)
     assert len(cwl_objs) == 2
+
+
+def test_load_document_by_string_parsers(monkeypatch: MonkeyPatch) -> None:
+    """Test that the libyaml and ruamel.yaml code paths load the same document."""
+    with open(TEST_v1_0_CWL) as cwl_h:
+        doc = cwl_h.read()
+    uri = Path(TEST_v1_0_CWL).resolve().as_uri()
+    fast_obj = load_document_by_string(doc, uri)
+    monkeypatch.setattr(cwl_utils.parser, "USE_LIBYAML", False)
+    slow_obj = load_document_by_string(doc, uri)
+    assert save(fast_obj) == save(slow_obj)
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("9", 9),
+        ("09", 9),
+        ("017", 17),
+        ("-017", -17),
+        ("+12", 12),
+        ("1_000", 1000),
+        ("0o17", 15),
+        ("0x1F", 31),
+        ("0b101", 5),
+    ],
+)
+def test_load_document_by_string_parsers_int(
+    monkeypatch: MonkeyPatch, value: str, expected: int
+) -> None:
+    """Test that both YAML parsers read integers with YAML 1.2 semantics."""
+    doc = (
+        "cwlVersion: v1.2\n"
+        "class: CommandLineTool\n"
+        "baseCommand: echo\n"
+        "inputs:\n"
+        "  number:\n"
+        "    type: int\n"
+        f"    default: {value}\n"
+        "outputs: []\n"
+    )
+    uri = Path(TEST_v1_0_CWL).resolve().as_uri()
+    fast_obj = load_document_by_string(doc, uri)
+    monkeypatch.setattr(cwl_utils.parser, "USE_LIBYAML", False)
+    slow_obj = load_document_by_string(doc, uri)
+    assert fast_obj.inputs[0].default == expected
+    assert slow_obj.inputs[0].default == expected
+
+
+@pytest.mark.parametrize("use_libyaml", [True, False])
+def test_load_document_by_string_duplicate_key(
+    monkeypatch: MonkeyPatch, use_libyaml: bool
+) -> None:
+    """Test that duplicate mapping keys are rejected by both YAML parsers."""
+    doc = (
+        "cwlVersion: v1.2\n"
+        "class: CommandLineTool\n"
+        "class: Workflow\n"
+        "inputs: []\n"
+        "outputs: []\n"
+    )
+    monkeypatch.setattr(cwl_utils.parser, "USE_LIBYAML", use_libyaml)
+    with raises(DuplicateKeyError):
+        load_document_by_string(doc, Path(TEST_v1_0_CWL).resolve().as_uri())
+
+
+def test_load_document_by_string_error_location(monkeypatch: MonkeyPatch) -> None:
+    """Test that validation errors report line numbers with both YAML parsers."""
+    doc = (
+        "cwlVersion: v1.2\n"
+        "class: CommandLineTool\n"
+        "baseCommand: echo\n"
+        "inputs:\n"
+        "  message:\n"
+        "    type: string\n"
+        "    inputBinding:\n"
+        "      separate: 12\n"
+        "outputs: []\n"
+    )
+    uri = Path(TEST_v1_0_CWL).resolve().as_uri()
+    with monkeypatch.context() as mp:
+        # the libyaml path must report locations without re-parsing
+        mp.setattr(cwl_utils.parser, "yaml_no_ts", None)
+        with raises(ValidationException, match=r"md5sum\.cwl:8:7:") as fast_exc:
+            load_document_by_string(doc, uri)
+    monkeypatch.setattr(cwl_utils.parser, "USE_LIBYAML", False)
+    with raises(ValidationException) as slow_exc:
+        load_document_by_string(doc, uri)
+    assert str(fast_exc.value) == str(slow_exc.value)
+
+
+def test_load_documents_by_uri() -> None:
+    """Test loading several documents at once, in order."""
+    uris = [
+        Path(TEST_v1_0_CWL).resolve().as_uri(),
+        Path(TEST_v1_2_CWL).resolve().as_uri(),
+        Path(get_data("testdata/echo-tool-packed.cwl")).resolve().as_uri() + "#main",
+    ]
+    cwl_objs = load_documents_by_uri(uris)
+    assert [cwl_obj.cwlVersion for cwl_obj in cwl_objs] == ["v1.0", "v1.2", "v1.2"]
+    assert cwl_objs[2].id == uris[2]
+
+
+def test_load_document_by_uri_cache(monkeypatch: MonkeyPatch) -> None:
+    """Test that a remote document is only fetched once and objects are not shared."""
+    with open(TEST_v1_0_CWL) as cwl_h:
+        text = cwl_h.read()
+    fetched: List[str] = []
+
+    def fetch_text(self: Any, url: str, content_types: Any = None) -> str:
+        fetched.append(url)
+        return text
+
+    monkeypatch.setattr(DefaultFetcher, "fetch_text", fetch_text)
+    uri = "https://example.com/md5sum.cwl"
+    clear_document_cache()
+    first = load_document_by_uri(uri)
+    second = load_document_by_uri(uri)
+    assert first is not second
+    assert save(first) == save(second)
+    assert fetched == [uri]
+    clear_document_cache()
+    load_document_by_uri(uri)
+    assert fetched == [uri, uri]
+    clear_document_cache()
+
+
+def test_load_document_by_uri_local_not_cached(tmp_path: Path) -> None:
+    """Test that a local document is read again after it has changed."""
+    cwl_file = tmp_path / "echo.cwl"
+    tool = (
+        "cwlVersion: v1.2\n"
+        "class: CommandLineTool\n"
+        "baseCommand: {}\n"
+        "inputs: []\n"
+        "outputs: []\n"
+    )
+    cwl_file.write_text(tool.format("echo"))
+    assert load_document_by_uri(cwl_file).baseCommand == "echo"
+    cwl_file.write_text(tool.format("cat"))
+    assert load_document_by_uri(cwl_file).baseCommand == "cat"
+
+
+@pytest.mark.parametrize("use_libyaml", [True, False])
+@pytest.mark.parametrize(
+    "doc,message",
+    [
+        ("- class: CommandLineTool\n", "MutableMapping is required"),
+        ("class: CommandLineTool\ninputs: []\n", "could not get the cwlVersion"),
+        ("cwlVersion: v0.9\nclass: CommandLineTool\n", "Did not recognise v0.9"),
+    ],
+)
+def test_load_document_by_string_bad_version(
+    monkeypatch: MonkeyPatch, use_libyaml: bool, doc: str, message: str
+) -> None:
+    """Test that documents without a usable cwlVersion are rejected."""
+    monkeypatch.setattr(cwl_utils.parser, "USE_LIBYAML", use_libyaml)
+    with raises(ValidationException, match=message):
+        load_document_by_string(doc, Path(TEST_v1_0_CWL).resolve().as_uri())
+
+
+def test_version_split() -> None:
+    """Test splitting cwlVersion values, with and without the leading 'v'."""
+    assert version_split("v1.2") == (1, 2)
+    assert version_split("v1.2.1") == (1, 2, 1)
+    assert version_split("1.0") == (1, 0)
+    assert max(["v1.0", "v1.10", "v1.2"], key=version_split) == "v1.10"